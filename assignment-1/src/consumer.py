@@ -1,48 +1,72 @@
 """Consumer thread: reads from shared buffer and writes to destination container."""
 
 import threading
-import time
 import logging
 
+logger = logging.getLogger(__name__)
+
+
 class Consumer(threading.Thread):
     """Continuously retrieves items from buffer and stores to destination until poison pill."""
 
-    def __init__(self, buffer, destination):
+    def __init__(self, buffer, destination, pacing=0.0, batch_size=8, shutdown=None):
         super().__init__(name="Consumer")
         self.buffer = buffer
         self.destination = destination
+        self.pacing = pacing  # optional per-item delay (seconds) for demo visibility
+        self.batch_size = batch_size  # items moved per lock hold
+        # Shared Event lets main abort pacing waits immediately on error
+        self.shutdown = shutdown if shutdown is not None else threading.Event()
+        buffer.add_consumer()  # register for coordinated shutdown
 
     def run(self):
-        """Get items from buffer, store to destination, stop on poison pill (None).
-        
-        For multiple consumers: when a consumer receives a poison pill, it puts it back
-        in the buffer so other consumers can also receive it and terminate.
+        """Drain batches from buffer, store to destination, stop on poison pill (None).
+
+        The buffer sends exactly one poison pill per registered consumer when the
+        last producer finishes, so each consumer keeps the pill it receives and
+        simply exits — no passing pills back around. get_many only ever yields a
+        pill as the last element of a batch, so the items before it are stored
+        normally first.
         """
+        # Bind hot-loop lookups to locals once (LOAD_FAST beats chained LOAD_ATTR)
+        get_many = self.buffer.get_many
+        store_many = self.destination.store_many
+        batch_size = self.batch_size
+        pacing = self.pacing
+        shutdown_wait = self.shutdown.wait
         try:
             while True:
                 try:
                     # consumer basically polls for new data in the queue
-                    item = self.buffer.get()  # Blocks if buffer is empty
+                    batch = get_many(batch_size)  # Blocks if buffer is empty
 
-                    if item is None:  # Poison pill received
-                        logging.debug(f"{self.name}: Received poison pill, passing it on and exiting")
-                        # Put poison pill back for other consumers
-                        self.buffer.put(None)
-                        break
+                    stopping = batch[-1] is None  # Poison pill is always last if present
+                    if stopping:
+                        batch.pop()
+
+                    if batch:
+                        store_many(batch)
+                        # Guard so snapshot() (an O(buffer) copy) only runs when DEBUG is on
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("%s: GOT %s → Buffer: %s", self.name, batch, self.buffer.snapshot())
 
-                    self.destination.store(item)
-                    logging.debug(f"{self.name}: GOT {item} → Buffer: {self.buffer.snapshot()}")
+                    if stopping:
+                        logger.debug("%s: Received poison pill, exiting", self.name)
+                        break
 
-                    time.sleep(0.09)
+                    # Event.wait doubles as the pacing sleep but returns early
+                    # (True) the moment a shutdown is signalled
+                    if pacing and shutdown_wait(pacing):
+                        logger.debug("%s: shutdown signalled, exiting early", self.name)
+                        break
                     
                 except AttributeError as e:
-                    logging.error(f"Consumer: Invalid buffer/destination object: {e}")
+                    logger.error(f"Consumer: Invalid buffer/destination object: {e}")
                     raise
                 except Exception as e:
-                    logging.error(f"Consumer: Error processing item {item}: {e}")
+                    logger.error(f"Consumer: Error processing batch {batch}: {e}")
                     raise
-                    
+
         except Exception as e:
-            logging.critical(f"Consumer thread failed: {e}", exc_info=True)
-            raise
+            logger.critical(f"Consumer thread failed: {e}", exc_info=True)
             raise
@@ -1,13 +1,18 @@
 # UPDATED: Now supports MULTIPLE threads accessing each container
 
-# SourceContainer can be shared by multiple Producers - requires Lock
-# DestinationContainer can be shared by multiple Consumers - requires Lock
+# SourceContainer can be shared by multiple Producers
+# DestinationContainer can be shared by multiple Consumers
 
-# Thread-safe operations ensure no race conditions when multiple threads
-# read from source or write to destination concurrently
+# Neither container needs its own Lock: the source hands out indices into an
+# immutable tuple through next() on an itertools.count, and the destination's
+# list.append() is a single C operation — both atomic under CPython's GIL, so
+# the per-item acquire/release pairs were pure overhead with no correctness gain.
 
-from threading import Lock
-from collections import deque
+from itertools import count
+
+# Sentinel marking an unfilled preallocated slot (stored items may be anything
+# except the poison pill, so a private object is the only safe marker)
+_EMPTY = object()
 
 
 class SourceContainer:
@@ -18,31 +23,51 @@ class SourceContainer:
 
     def __init__(self, items):
         """Initialize source container with items.
-        
+
         Args:
             items: Iterable of items to process
-            
+
         Raises:
             TypeError: If items is not iterable
         """
         try:
-            # Use deque for O(1) popleft instead of list.pop(0) which is O(n)
-            self.items = deque(items)
+            # Immutable tuple shared read-only by every producer; FIFO order
+            # comes from handing out indices via next() on an itertools.count,
+            # which is C-implemented and atomic under the GIL. Producers then
+            # read items[i] with no mutation and no lock at all.
+            self.items = tuple(items)
         except TypeError as e:
             raise TypeError(f"items must be iterable, got {type(items).__name__}: {e}")
-        
-        self.lock = Lock()  # Protect concurrent access
+        self._idx = count()
 
     def read_next(self):
         """Read next item from source (thread-safe).
-        
+
         Returns:
             Next item or None if exhausted
         """
-        with self.lock:  # Atomic read-and-remove
-            if not self.items:
-                return None  # Exhausted - each producer will get None once
-            return self.items.popleft()  # O(1) FIFO
+        i = next(self._idx)  # atomic index handout
+        return self.items[i] if i < len(self.items) else None
+
+    def read_many(self, k):
+        """Read up to k items from source in one call (thread-safe).
+
+        Args:
+            k: Maximum number of items to return
+
+        Returns:
+            List of up to k items; empty list if exhausted
+        """
+        items = self.items
+        n = len(items)
+        idx = self._idx
+        batch = []
+        for _ in range(k):
+            i = next(idx)
+            if i >= n:
+                break  # Exhausted
+            batch.append(items[i])
+        return batch
 
 
 class DestinationContainer:
@@ -51,37 +76,89 @@ class DestinationContainer:
     Can be safely shared by multiple consumer threads.
     """
 
-    def __init__(self):
-        """Initialize empty destination container."""
-        self.items = []
-        self.lock = Lock()  # Protect concurrent writes
+    def __init__(self, expected_size=None):
+        """Initialize destination container.
+
+        Args:
+            expected_size: Optional total item count. When given, the backing
+                list is preallocated once and filled via an atomic index,
+                avoiding the geometric reallocations of repeated append.
+                Must be >= the number of items eventually stored.
+
+        Raises:
+            ValueError: If expected_size is not a positive integer
+        """
+        if expected_size is None:
+            self.items = []
+            self._idx = None
+        else:
+            if not isinstance(expected_size, int) or expected_size <= 0:
+                raise ValueError(f"expected_size must be a positive integer, got {expected_size}")
+            self.items = [_EMPTY] * expected_size
+            self._idx = count()  # next() is C-implemented and atomic under the GIL
 
     def store(self, item):
         """Store item to destination (thread-safe).
-        
+
         Args:
             item: Item to store
         """
-        with self.lock:  # Atomic append
-            self.items.append(item)
-    
+        if self._idx is None:
+            self.items.append(item)  # list.append is atomic under the GIL
+        else:
+            self.items[next(self._idx)] = item  # claim a slot, then fill it
+
+    def store_many(self, items):
+        """Store a batch of items to destination (thread-safe).
+
+        Args:
+            items: List of items to store
+        """
+        if self._idx is None:
+            self.items.extend(items)  # single C-level extend, atomic under the GIL
+        else:
+            slots = self.items
+            idx = self._idx
+            for item in items:
+                slots[next(idx)] = item
+
     def get_items(self):
         """Get all stored items (thread-safe read).
-        
+
         Returns:
-            Copy of items list
+            Copy of items list (unfilled preallocated slots are skipped)
         """
-        with self.lock:
-            return list(self.items)
+        if self._idx is None:
+            return list(self.items)  # one-shot C-level copy, atomic under the GIL
+        return [item for item in self.items if item is not _EMPTY]
 
+    def snapshot(self):
+        """Get stored items as an immutable tuple (thread-safe read).
 
-"""
-If we changed the architecture so that multiple producers were pulling from the same SourceContainer, 
-or multiple consumers were writing into the same DestinationContainer, those operations would become race conditions.
+        Cheaper than get_items() for callers that only need to len()/sorted()
+        the result: tuple construction is a single C-level copy and the result
+        can be shared without defensive copying.
+
+        Returns:
+            Tuple of stored items
+        """
+        if self._idx is None:
+            return tuple(self.items)
+        return tuple(item for item in self.items if item is not _EMPTY)
 
-The fix is straightforward:
+    def __len__(self):
+        """Return number of items stored (no copy)."""
+        if self._idx is None:
+            return len(self.items)
+        return sum(1 for item in self.items if item is not _EMPTY)
 
--> Add a threading.Lock() inside each container.
 
--> Wrap all modifying operations (pop, append, etc.) inside a with lock: block.
+"""
+Earlier versions stored the source in a deque and guarded every popleft/append
+with a threading.Lock; a later pass dropped the locks but still serialized all
+producers on the shared deque's mutation. With the tuple + count() scheme the
+source is never mutated at all: producers do parallel read-only traversals of
+an immutable sequence and only the index handout is (GIL-atomically) shared.
+If the containers ever grow compound operations (read-modify-write across
+multiple steps), those operations will need a lock again.
 """
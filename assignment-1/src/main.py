@@ -1,29 +1,39 @@
-"""Main entry point: demonstrates producer-consumer pattern with bounded buffer."""
+"""Main entry point: demonstrates producer-consumer pattern with bounded buffer.
+
+Logging defaults to WARNING so the demo loop is not dominated by per-item
+record formatting; set LOGLEVEL=DEBUG in the environment to get the full
+item-by-item thread trace.
+"""
 
 import logging
+import os
+import threading
 from src.container import SourceContainer, DestinationContainer
-from src.shared_buff import SharedBuffer
+from src.shared_buff import make_buffer
 from src.producer import Producer
 from src.consumer import Consumer
 
-# Configure logging to show thread activity and timing
+# Configure logging to show thread activity and timing (LOGLEVEL=DEBUG for the trace)
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.getenv("LOGLEVEL", "WARNING"),
     format="%(asctime)s [%(threadName)s] %(message)s",
     datefmt="%H:%M:%S"
 )
 
 def run_demo():
     """Run producer-consumer demo: transfer items from source to destination via bounded buffer."""
+    shutdown = threading.Event()  # aborts pacing waits immediately on error
     try:
         # Setup: source with data, empty destination, buffer with capacity of 2
         source = SourceContainer([1234,2345,3456,4567,5678,6789])
         dest = DestinationContainer() #this is empty
-        buffer = SharedBuffer(max_size=2) #let's assume we have a buzzer size of 2, so our dequque can only hold 2 items max.
+        # Factory picks the lock-free SPSC ring for the 1P/1C topology
+        buffer = make_buffer(max_size=2, n_producers=1, n_consumers=1) #let's assume we have a buzzer size of 2, so our dequque can only hold 2 items max.
 
-        # Create producer and consumer threads
-        producer = Producer(source, buffer)
-        consumer = Consumer(buffer, dest)
+        # Create producer and consumer threads (paced, batch of 1, so the
+        # log output stays a readable item-by-item trace)
+        producer = Producer(source, buffer, pacing=0.05, batch_size=1, shutdown=shutdown)
+        consumer = Consumer(buffer, dest, pacing=0.09, batch_size=1, shutdown=shutdown)
 
         # Start both threads (run concurrently)
         producer.start()
@@ -38,16 +48,19 @@ def run_demo():
             logging.error("Threads did not complete within timeout - possible deadlock")
             raise RuntimeError("Producer-consumer threads timed out")
 
-        print("Final destination:", dest.get_items())
+        print("Final destination:", dest.snapshot())
         logging.info("Demo completed successfully")
         
     except ValueError as e:
+        shutdown.set()  # wake any thread parked in a pacing wait
         logging.error(f"Invalid configuration: {e}")
         raise
     except RuntimeError as e:
+        shutdown.set()
         logging.error(f"Runtime error during execution: {e}")
         raise
     except Exception as e:
+        shutdown.set()
         logging.error(f"Unexpected error in run_demo: {e}", exc_info=True)
         raise
 
@@ -60,22 +73,23 @@ def run_multi_demo():
       - 2 consumers sharing same destination
       - Thread-safe concurrent operation
     """
+    shutdown = threading.Event()  # aborts pacing waits immediately on error
     try:
         logging.info("Starting multi-producer multi-consumer demo")
         
         # Create shared resources
         items = list(range(1, 21))  # 20 items
         source = SourceContainer(items)
-        dest = DestinationContainer()
-        buffer = SharedBuffer(max_size=3)
-        
-        # Create 2 producers sharing the same source
-        producer1 = Producer(source, buffer)
-        producer2 = Producer(source, buffer)
+        dest = DestinationContainer(expected_size=len(items))  # total count is known up front
+        buffer = make_buffer(max_size=3, n_producers=2, n_consumers=2)
         
+        # Create 2 producers sharing the same source (paced for readable logs)
+        producer1 = Producer(source, buffer, pacing=0.05, batch_size=1, shutdown=shutdown)
+        producer2 = Producer(source, buffer, pacing=0.05, batch_size=1, shutdown=shutdown)
+
         # Create 2 consumers sharing the same destination
-        consumer1 = Consumer(buffer, dest)
-        consumer2 = Consumer(buffer, dest)
+        consumer1 = Consumer(buffer, dest, pacing=0.09, batch_size=1, shutdown=shutdown)
+        consumer2 = Consumer(buffer, dest, pacing=0.09, batch_size=1, shutdown=shutdown)
         
         # Start all threads
         logging.info("Starting 2 producers and 2 consumers...")
@@ -96,7 +110,7 @@ def run_multi_demo():
             raise RuntimeError("Multi-threaded demo timed out")
         
         # Display results
-        result = dest.get_items()
+        result = dest.snapshot()
         print(f"\nMulti-Producer Multi-Consumer Demo:")
         print(f"  Items produced: {items}")
         print(f"  Items consumed: {sorted(result)}")
@@ -106,6 +120,7 @@ def run_multi_demo():
         logging.info("Multi-demo completed successfully")
         
     except Exception as e:
+        shutdown.set()  # wake any thread parked in a pacing wait
         logging.error(f"Error in multi-demo: {e}", exc_info=True)
         raise
 
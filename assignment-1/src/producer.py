@@ -1,41 +1,55 @@
 """Producer thread: reads from source container and writes to shared buffer."""
 
 import threading
-import time
 import logging
 
+logger = logging.getLogger(__name__)
+
+
 class Producer(threading.Thread):
     """Continuously reads items from source and pushes to buffer until EOF (None)."""
 
-    def __init__(self, source, buffer):
+    def __init__(self, source, buffer, pacing=0.0, batch_size=8, shutdown=None):
         super().__init__(name="Producer")
         self.source = source
         self.buffer = buffer
+        self.pacing = pacing  # optional per-item delay (seconds) for demo visibility
+        self.batch_size = batch_size  # items moved per lock hold
+        # Shared Event lets main abort pacing waits immediately on error
+        self.shutdown = shutdown if shutdown is not None else threading.Event()
+        buffer.add_producer()  # register for coordinated shutdown
 
     def run(self):
-        """Read items from source, put into buffer, send poison pill (None) when done."""
+        """Read batches from source, put into buffer, send poison pill (None) when done."""
+        # Bind hot-loop lookups to locals once (LOAD_FAST beats chained LOAD_ATTR)
+        read_many = self.source.read_many
+        put_many = self.buffer.put_many
+        batch_size = self.batch_size
+        pacing = self.pacing
+        shutdown_wait = self.shutdown.wait
+        # Single try around the whole loop: exception setup happens once, not
+        # per iteration, and the hot path carries no per-item handler blocks
         try:
             while True:
-                try:
-                    item = self.source.read_next()
-                    if item is None:  # End of data stream
-                        logging.debug("Producer sending stop signal (None)")
-                        self.buffer.put(None)  # Signal consumer to stop
-                        break
-
-                    self.buffer.put(item)  # Blocks if buffer is full
-                    logging.debug(f"PUT {item} → Buffer: {self.buffer.snapshot()}")
-                    time.sleep(0.05)
-                    
-                except AttributeError as e:
-                    logging.error(f"Producer: Invalid source/buffer object: {e}")
-                    raise
-                except Exception as e:
-                    logging.error(f"Producer: Error processing item: {e}")
-                    # Send poison pill on error to prevent consumer deadlock
-                    self.buffer.put(None)
-                    raise
-                    
+                batch = read_many(batch_size)
+                if not batch:  # End of data stream
+                    logger.debug("Producer done; signalling buffer")
+                    self.buffer.producer_done()  # Last producer out sends the pills
+                    break
+
+                put_many(batch)  # Blocks while buffer is full
+                # Guard so snapshot() (an O(buffer) copy) only runs when DEBUG is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("PUT %s → Buffer: %s", batch, self.buffer.snapshot())
+                # Event.wait doubles as the pacing sleep but returns early
+                # (True) the moment a shutdown is signalled
+                if pacing and shutdown_wait(pacing):
+                    logger.debug("Producer: shutdown signalled, retiring early")
+                    self.buffer.producer_done()
+                    break
+
         except Exception as e:
-            logging.critical(f"Producer thread failed: {e}", exc_info=True)
+            logger.critical(f"Producer thread failed: {e}", exc_info=True)
+            # Retire this producer on error so consumers still shut down cleanly
+            self.buffer.producer_done()
             raise
@@ -3,36 +3,37 @@ Thread-safe bounded buffer for producer-consumer synchronization.
 Uses Condition variables for wait/notify mechanism.
 """
 
-# The SharedBuffer is a manually synchronized bounded buffer built on a deque and a Condition.
-# I chose deque because it offers O(1) append/pop operations and gives me full control over synchronization, 
-# unlike queue.Queue, which hides the locking internals.
-# put() blocks when the buffer is full, and get() blocks when empty. 
-# Both use condition.wait() and condition.notify_all() to coordinate producer and consumer threads.
+# The SharedBuffer is a manually synchronized bounded buffer built on a deque
+# and two counting Semaphores — the textbook bounded-buffer encoding:
+# `slots` counts free capacity (starts at max_size), `items` counts queued
+# elements (starts at 0). put() blocks on slots when full, get() blocks on
+# items when empty, and a short mutex guards only the deque mutation itself.
+# Compared with hand-rolled Condition predicates, the full/empty tests run at
+# C speed inside the semaphores and producers/consumers pass through in
+# parallel up to capacity instead of serializing on one condition.
 
-from collections import deque # O(1) 
-from threading import Condition
-
-# Lock only gives me mutual exclusion
-
-# Condition gives coordination (wait for state change)
+import queue
+import time
+from collections import deque # O(1)
+from threading import Lock, Semaphore
 
 class SharedBuffer:
     """
     Thread-safe bounded buffer using Condition variables.
-    
+
     Implements classic blocking queue pattern:
     - Producers block when full
     - Consumers block when empty
     - FIFO ordering guaranteed
     """
-    
+
     def __init__(self, max_size):
         """
         Initialize buffer with maximum capacity.
-        
+
         Args:
             max_size: Maximum number of items buffer can hold
-            
+
         Raises:
             ValueError: If max_size is not a positive integer
         """
@@ -40,59 +41,353 @@ class SharedBuffer:
             raise ValueError(f"max_size must be an integer, got {type(max_size).__name__}")
         if max_size <= 0:
             raise ValueError(f"max_size must be positive, got {max_size}")
-            
+
         self.max_size = max_size
-        self.buffer = deque()  # FIFO queue
-        self.condition = Condition()  # For wait/notify synchronization
+        # maxlen bounds the ring at C level; the slots semaphore guarantees we
+        # never actually hit it, so no append can silently evict from the left
+        self.buffer = deque(maxlen=max_size)  # FIFO queue
+        self.mutex = Lock()  # Guards the deque mutation only
+        self.slots = Semaphore(max_size)  # Free capacity; producers block here
+        self.items = Semaphore(0)  # Queued elements; consumers block here
+        self._counts_lock = Lock()  # Guards the registration counters
+        self.num_producers = 0
+        self.num_consumers = 0
+
+    def add_producer(self):
+        """Register a producer (called from Producer.__init__, before start)."""
+        with self._counts_lock:
+            self.num_producers += 1
+
+    def add_consumer(self):
+        """Register a consumer (called from Consumer.__init__, before start)."""
+        with self._counts_lock:
+            self.num_consumers += 1
+
+    def producer_done(self):
+        """Signal that one producer has finished.
+
+        The last producer to finish closes the buffer by enqueueing exactly
+        one poison pill (None) per registered consumer, so every consumer
+        receives its own pill and none has to pass a pill back around.
+        This replaces the old single-pill scheme, under which N-1 consumers
+        could block forever on get() once the lone pill was consumed.
+        """
+        with self._counts_lock:
+            self.num_producers -= 1
+            if self.num_producers > 0:
+                return  # Other producers are still pushing items
+            pills = max(self.num_consumers, 1)  # At least one for raw get() callers
+        for _ in range(pills):
+            self.put(None)
 
     def put(self, item): # producer to add elements to buffer
         """
         Add item to buffer (blocks if full).
-        
+
         Producer thread calls this. Will wait if buffer is at capacity,
         then wake up when consumer removes an item.
-        
+
         Args:
             item: Data to add (can be None for poison pill)
         """
-        with self.condition:  # Acquire lock :[1,2]
-            # Wait while buffer is full
-            while len(self.buffer) >= self.max_size:
-                self.condition.wait()  # Release lock and sleep 
-            
-            # Add item to end of queue
+        self.slots.acquire()  # Blocks while buffer is full
+        with self.mutex:
+            assert len(self.buffer) < self.max_size, "slots semaphore out of sync"
             self.buffer.append(item)
-            
-            # Wake up any waiting consumers #.notify()
-            self.condition.notify_all()
+        self.items.release()  # One item available → unblocks one consumer
 
     def get(self): # used by consuemr to get data from the buffer
         """
         Remove and return item from buffer (blocks if empty).
-        
+
         Consumer thread calls this. Will wait if buffer is empty,
         then wake up when producer adds an item.
-        
+
         Returns:
             Item from front of queue
         """
-        with self.condition:  # Acquire lock
-            # Wait while buffer is empty
-            while len(self.buffer) == 0: # []
-                self.condition.wait()  # Release lock and sleep
-            
-            # Remove item from front of queue (FIFO)
+        self.items.acquire()  # Blocks while buffer is empty
+        with self.mutex:
             item = self.buffer.popleft()
-            
-            # Wake up any waiting producers
-            self.condition.notify_all()
-            
-            return item
+        self.slots.release()  # One slot freed → unblocks one producer
+        return item
+
+    def put_many(self, items):
+        """
+        Add a batch of items to buffer (blocks while full).
+
+        Blocks for one slot, then greedily grabs whatever extra capacity is
+        free without blocking, so one mutex hold pushes as much of the batch
+        as fits. Holding out for the full batch size would risk deadlock
+        between batching producers, so partial pushes are taken instead.
+
+        Args:
+            items: List of items to add, in order
+        """
+        idx = 0
+        n = len(items)
+        while idx < n:
+            self.slots.acquire()  # Blocks until at least one slot is free
+            k = 1
+            while idx + k < n and self.slots.acquire(blocking=False):
+                k += 1  # Take any further free slots without waiting
+
+            with self.mutex:
+                assert len(self.buffer) + k <= self.max_size, "slots semaphore out of sync"
+                self.buffer.extend(items[idx:idx + k])
+            idx += k
+            self.items.release(k)  # One wake per item added
+
+    def get_many(self, max_n):
+        """
+        Remove and return up to max_n items from buffer (blocks if empty).
+
+        Drains whatever is available under a single mutex hold. A poison
+        pill (None) is only ever returned as the last element of the batch,
+        so callers can process the preceding items before shutting down.
+
+        Args:
+            max_n: Maximum number of items to return
+
+        Returns:
+            Non-empty list of items in FIFO order
+        """
+        self.items.acquire()  # Blocks until at least one item is queued
+        k = 1
+        while k < max_n and self.items.acquire(blocking=False):
+            k += 1  # Claim any further queued items without waiting
+
+        taken = []
+        with self.mutex:
+            while len(taken) < k:
+                item = self.buffer.popleft()
+                taken.append(item)
+                if item is None:
+                    break  # Never return items queued behind a poison pill
+
+        # Refund permits for claimed-but-unpopped items left behind the pill
+        unpopped = k - len(taken)
+        if unpopped:
+            self.items.release(unpopped)
+        self.slots.release(len(taken))  # One wake per slot freed
+
+        return taken
 
     def snapshot(self):
         """Return current buffer contents (for debugging/testing)."""
-        return list(self.buffer)
+        with self.mutex:
+            return list(self.buffer)
 
     def __len__(self):
         """Return current number of items in buffer."""
-        return len(self.buffer)
\ No newline at end of file
+        return len(self.buffer)
+
+
+class SharedBufferFast:
+    """
+    Bounded buffer backed by queue.Queue, whose put/get hot paths run in C.
+
+    Drop-in replacement for SharedBuffer when the Python-level Condition
+    bookkeeping above is not needed for its own sake (the demo, production
+    use). The manual SharedBuffer stays around as the pedagogical version
+    exercised by the tests.
+    """
+
+    def __init__(self, max_size):
+        """
+        Initialize buffer with maximum capacity.
+
+        Args:
+            max_size: Maximum number of items buffer can hold
+
+        Raises:
+            ValueError: If max_size is not a positive integer
+        """
+        if not isinstance(max_size, int):
+            raise ValueError(f"max_size must be an integer, got {type(max_size).__name__}")
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+
+        self.max_size = max_size
+        self._q = queue.Queue(maxsize=max_size)
+        self._counts_lock = Lock()
+        self.num_producers = 0
+        self.num_consumers = 0
+
+    def add_producer(self):
+        """Register a producer (called from Producer.__init__, before start)."""
+        with self._counts_lock:
+            self.num_producers += 1
+
+    def add_consumer(self):
+        """Register a consumer (called from Consumer.__init__, before start)."""
+        with self._counts_lock:
+            self.num_consumers += 1
+
+    def producer_done(self):
+        """Last-finishing producer sends one poison pill per registered consumer."""
+        with self._counts_lock:
+            self.num_producers -= 1
+            if self.num_producers > 0:
+                return
+            pills = max(self.num_consumers, 1)
+        for _ in range(pills):
+            self._q.put(None)
+
+    def put(self, item):
+        """Add item to buffer (blocks if full)."""
+        self._q.put(item)
+
+    def get(self):
+        """Remove and return item from buffer (blocks if empty)."""
+        return self._q.get()
+
+    def put_many(self, items):
+        """Add a batch of items to buffer, blocking as needed."""
+        put = self._q.put
+        for item in items:
+            put(item)
+
+    def get_many(self, max_n):
+        """Remove up to max_n items; a poison pill (None) is always last."""
+        taken = [self._q.get()]  # Block for the first item only
+        if taken[0] is None:
+            return taken
+        while len(taken) < max_n:
+            try:
+                item = self._q.get_nowait()  # Drain whatever is ready
+            except queue.Empty:
+                break
+            taken.append(item)
+            if item is None:
+                break
+        return taken
+
+    def snapshot(self):
+        """Return current buffer contents (for debugging/testing)."""
+        with self._q.mutex:
+            return list(self._q.queue)
+
+    def __len__(self):
+        """Return current number of items in buffer."""
+        return self._q.qsize()
+
+
+class SPSCBuffer:
+    """
+    Lock-free bounded ring buffer for exactly one producer and one consumer
+    (Lamport's single-producer/single-consumer queue).
+
+    head is written only by the consumer and tail only by the producer, and
+    int reads/writes are atomic under the GIL, so no lock or Condition is
+    needed at all: put/get are a couple of attribute loads plus one list
+    assignment. Full/empty waits busy-yield via time.sleep(0) instead of
+    blocking. Do NOT share this buffer between multiple producers or
+    multiple consumers — use SharedBuffer for that.
+    """
+
+    def __init__(self, max_size):
+        """
+        Initialize ring with maximum capacity.
+
+        Args:
+            max_size: Maximum number of items buffer can hold
+
+        Raises:
+            ValueError: If max_size is not a positive integer
+        """
+        if not isinstance(max_size, int):
+            raise ValueError(f"max_size must be an integer, got {type(max_size).__name__}")
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+
+        self.max_size = max_size
+        self._n = max_size + 1  # one slot kept empty to distinguish full from empty
+        self._buf = [None] * self._n
+        self._head = 0  # next index to read; written only by the consumer
+        self._tail = 0  # next index to write; written only by the producer
+        self.num_producers = 0
+        self.num_consumers = 0
+
+    def add_producer(self):
+        """Register a producer (called from Producer.__init__, before start)."""
+        self.num_producers += 1
+
+    def add_consumer(self):
+        """Register a consumer (called from Consumer.__init__, before start)."""
+        self.num_consumers += 1
+
+    def producer_done(self):
+        """Producer finished: send the poison pill to the single consumer."""
+        self.num_producers -= 1
+        if self.num_producers <= 0:
+            self.put(None)
+
+    def put(self, item):
+        """Add item to buffer (busy-yields while full)."""
+        nxt = (self._tail + 1) % self._n
+        while nxt == self._head:  # full — yield until the consumer advances head
+            time.sleep(0)
+        self._buf[self._tail] = item
+        self._tail = nxt  # publish only after the slot is written
+
+    def get(self):
+        """Remove and return item from buffer (busy-yields while empty)."""
+        head = self._head
+        while head == self._tail:  # empty — yield until the producer advances tail
+            time.sleep(0)
+        item = self._buf[head]
+        self._buf[head] = None  # drop the reference for GC
+        self._head = (head + 1) % self._n
+        return item
+
+    def put_many(self, items):
+        """Add a batch of items in order, busy-yielding as needed."""
+        put = self.put
+        for item in items:
+            put(item)
+
+    def get_many(self, max_n):
+        """Remove up to max_n ready items; a poison pill (None) is always last."""
+        taken = [self.get()]  # Wait for the first item only
+        if taken[0] is None:
+            return taken
+        while len(taken) < max_n and self._head != self._tail:
+            item = self.get()
+            taken.append(item)
+            if item is None:
+                break
+        return taken
+
+    def snapshot(self):
+        """Return current buffer contents (for debugging/testing)."""
+        head, tail = self._head, self._tail
+        return [self._buf[i % self._n] for i in range(head, head + (tail - head) % self._n)]
+
+    def __len__(self):
+        """Return current number of items in buffer."""
+        return (self._tail - self._head) % self._n
+
+
+def make_buffer(max_size, n_producers=1, n_consumers=1):
+    """Pick the cheapest buffer implementation for a known thread topology.
+
+    The caller usually knows at construction time how many producers and
+    consumers will share the buffer, so it can dispatch to the minimal
+    synchronization up front: the lock-free SPSC ring for exactly one of
+    each, the semaphore-gated SharedBuffer otherwise. Producer/Consumer
+    only rely on the common put/get interface and need no changes.
+
+    Args:
+        max_size: Maximum number of items the buffer can hold
+        n_producers: Number of producer threads that will share the buffer
+        n_consumers: Number of consumer threads that will share the buffer
+
+    Returns:
+        SPSCBuffer for a 1-producer/1-consumer topology, else SharedBuffer
+    """
+    if n_producers == 1 and n_consumers == 1:
+        return SPSCBuffer(max_size)
+    # The semaphore-based SharedBuffer already costs nothing extra for the
+    # single-producer case, so MPSC and MPMC share one implementation.
+    return SharedBuffer(max_size)
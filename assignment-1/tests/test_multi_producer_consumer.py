@@ -65,7 +65,7 @@ def test_two_producers_two_consumers():
     assert not consumer2.is_alive(), "Consumer 2 did not complete"
     
     # Verify all items transferred
-    result_items = dest.get_items()
+    result_items = dest.snapshot()
     assert len(result_items) == 20, f"Expected 20 items, got {len(result_items)}"
     
     # Verify no duplicates (each item appears exactly once)
@@ -110,7 +110,7 @@ def test_three_producers_one_consumer():
     assert not consumer.is_alive(), "Consumer did not complete"
     
     # Verify results
-    result_items = dest.get_items()
+    result_items = dest.snapshot()
     assert len(result_items) == 30, f"Expected 30 items, got {len(result_items)}"
     assert sorted(result_items) == items, "Items mismatch"
   
@@ -154,7 +154,7 @@ def test_one_producer_three_consumers():
         assert not c.is_alive(), "Consumer did not complete"
     
     # Verify results
-    result_items = dest.get_items()
+    result_items = dest.snapshot()
     assert len(result_items) == 30, f"Expected 30 items, got {len(result_items)}"
     assert sorted(result_items) == items, "Items mismatch"
 
@@ -183,7 +183,7 @@ def test_producer_consumer_ratios():
     for t in producers1 + consumers1:
         t.join(timeout=10)
     
-    result1 = dest1.get_items()
+    result1 = dest1.snapshot()
     assert len(result1) == 40, f"4P+2C: Expected 40 items, got {len(result1)}"
     assert sorted(result1) == items1, "4P+2C: Items mismatch"
     
@@ -201,7 +201,7 @@ def test_producer_consumer_ratios():
     for t in producers2 + consumers2:
         t.join(timeout=10)
     
-    result2 = dest2.get_items()
+    result2 = dest2.snapshot()
     assert len(result2) == 40, f"2P+4C: Expected 40 items, got {len(result2)}"
     assert sorted(result2) == items2, "2P+4C: Items mismatch"
 
@@ -248,6 +248,6 @@ def test_large_scale_multi_thread():
     elapsed = time.time() - start_time
     
     # Verify results
-    result_items = dest.get_items()
+    result_items = dest.snapshot()
     assert len(result_items) == 500, f"Expected 500 items, got {len(result_items)}"
     assert sorted(result_items) == items, "Items mismatch in large-scale test"
\ No newline at end of file
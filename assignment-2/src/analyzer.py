@@ -1,49 +1,92 @@
 """
-Functional analysis utilities for SalesRecord data.
-Uses: reduce, sorted, groupby, lambda transforms.
+Functional analysis utilities for SalesRecord / SalesTable data.
+Uses: hash-accumulate groupbys, fsum/map/attrgetter, heapq.nlargest.
 """
 
-from functools import reduce
-from itertools import groupby
+from collections import defaultdict
+from functools import lru_cache
+from heapq import nlargest
+from math import fsum
+from operator import attrgetter, itemgetter
 from datetime import datetime
 
+from .model import SalesTable
+
 
 # ---------------------------------------------------------
 # Helper: Extract YYYY-MM from ISO date
 # ---------------------------------------------------------
+@lru_cache(maxsize=None)
 def extract_month(date_str: str) -> str:
-    """Parse ISO date string and return YYYY-MM format for monthly grouping."""
+    """Parse ISO date string and return YYYY-MM format for monthly grouping.
+
+    For well-formed ISO dates ('2024-01-15') the month is just the first 7
+    characters, so a validated slice replaces the datetime.fromisoformat +
+    strftime round-trip (~two orders of magnitude cheaper); malformed input
+    still falls back to full parsing. Cached because the number of distinct
+    date strings is bounded by the days in the dataset, far below N records.
+    """
+    if len(date_str) >= 7 and date_str[4] == "-" and date_str[:4].isdigit() and date_str[5:7].isdigit():
+        return date_str[:7]
     try:
         return datetime.fromisoformat(date_str).strftime("%Y-%m")
     except Exception:
         return "unknown"
 
 
+# ---------------------------------------------------------
+# Helper: Grouped sum over parallel key/weight sequences
+# ---------------------------------------------------------
+def _group_sum(keys, weights):
+    """Sum weights per key over two parallel sequences: out[keys[i]] += weights[i].
+
+    The one binned-accumulation primitive behind every revenue-by-X grouping.
+    zip drives both sequences from C, so the loop body is just a hash lookup
+    and a float add per row — the closest stdlib equivalent of a bincount
+    kernel over (code, weight) arrays.
+
+    The final key-sort touches only the K-sized aggregate (O(K log K), K ≪ N)
+    to give callers a deterministic display order; the N records themselves
+    are never sorted.
+
+    Every grouped analysis routes through this one kernel, so if it ever
+    dominates a profile at much larger N it is the single function worth
+    compiling (Cython/Numba over factorized code arrays) — nothing else in
+    this module would need to change.
+    """
+    out = defaultdict(float)
+    for k, w in zip(keys, weights):
+        out[k] += w
+    return dict(sorted(out.items()))
+
+
 # =========================================================
 # 1. TOTAL REVENUE  (after discount)
 # =========================================================
 def total_revenue(records):
-    """Sum all record amounts using reduce: accumulator + current record amount.
-    1. Input: List of SalesRecord
-    2. For each record → read amount property (quantity × price × (1-discount))
-    3. Accumulate sum
-    
-    -- Sorting takes (O(n logn)), map takes O(N) but we need FP.
+    """Sum all record amounts with math.fsum.
+
+    fsum iterates in C like sum() (the old reduce+lambda paid a Python frame
+    per record) and additionally tracks partial sums, so the result is exact
+    rather than drifting by accumulated rounding error on large datasets.
 
     Example with 3 records:
-      Record 1: amount=1799.98 → acc=0.0 + 1799.98 = 1799.98
-      Record 2: amount=299.50 → acc=1799.98 + 299.50 = 2099.48
-      Record 3: amount=849.99 → acc=2099.48 + 849.99 = 2949.47
-    Result: 2949.47
-    
+      amounts 1799.98, 299.50, 849.99 → 2949.47
+
     Raises:
         ValueError: If records is empty or None
     """
     if not records:
         raise ValueError("Cannot calculate total revenue: records list is empty")
-    
-    return reduce(lambda acc, r: acc + r.amount, records, 0.0)
-    # i can also do this using; sum(r.amount for r in records)
+
+    if isinstance(records, SalesTable):
+        # Columnar fast path: fsum over a plain list of floats, no per-record
+        # attribute lookup.
+        return fsum(records.amount)
+
+    # attrgetter + map keep the whole reduction in C — no generator frame
+    # resumed per record
+    return fsum(map(attrgetter("amount"), records))
 
 
 # =========================================================
@@ -51,20 +94,21 @@ def total_revenue(records):
 # =========================================================
 def revenue_by_region(records):
     """Group records by region, sum amounts per group.
-    
-    1. Sort records by region
-    2. Apply groupby
-    3. For each region → sum item.amount
-    
-    After sort: [East records..., North records..., South records..., West records...]
-    Groupby yields: ('East', <itr>) → ('North', <itr>) → ..
-    Result: {'East': 12450.50, 'North': 15678.23, 'South': 10234.67, 'West': 9876.12}
+
+    Single O(N) pass over a hash-based accumulator — no sort needed, since
+    the aggregation is order-independent. (The old sort+groupby version paid
+    O(N log N) purely to make groupby's equal-keys-adjacent requirement hold.)
+
+    For each record → out[region] += amount
+    Result: {'North': 15678.23, 'East': 12450.50, 'South': 10234.67, 'West': 9876.12}
     """
-    recs = sorted(records, key=lambda r: r.region)  # Sort by region (required for groupby)
-    return {
-        region: sum(r.amount for r in group)  # Sum amounts for each region group
-        for region, group in groupby(recs, key=lambda r: r.region)
-    }
+    if isinstance(records, SalesTable):
+        # Columnar fast path: binned accumulation over two parallel columns
+        return _group_sum(records.region, records.amount)
+    out = defaultdict(float)
+    for r in records:
+        out[r.region] += r.amount  # Sum amounts for each region
+    return dict(sorted(out.items()))  # key-sort only the K-sized aggregate
 
 
 # =========================================================
@@ -72,38 +116,36 @@ def revenue_by_region(records):
 # =========================================================
 def revenue_by_category(records):
     """Group records by category, sum amounts per group.
-    
-    After sort: [Electronics..., Furniture..., Stationery...]
+
+    Single O(N) hash-accumulate pass, same shape as revenue_by_region.
     Result: {'Electronics': 28456.78, 'Furniture': 15234.89, 'Stationery': 4547.85}
     """
-    recs = sorted(records, key=lambda r: r.category)  # Sort by category (required for groupby)
-    return {
-        category: sum(r.amount for r in group)  # Sum amounts for each category group
-        for category, group in groupby(recs, key=lambda r: r.category)
-    }
+    if isinstance(records, SalesTable):
+        # Columnar fast path: binned accumulation over two parallel columns
+        return _group_sum(records.category, records.amount)
+    out = defaultdict(float)
+    for r in records:
+        out[r.category] += r.amount  # Sum amounts for each category
+    return dict(sorted(out.items()))  # key-sort only the K-sized aggregate
 
 
 # =========================================================
 # 4. TOP-N PRODUCTS BY REVENUE
 # =========================================================
 def top_n_products(records, n=5):
-    """Aggregate revenue per product using reduce, sort desc, take top N.
-    
-    - Use reduce to accumulate product → revenue mapping
-    - Sort by revenue descending
-    - Slice top N
-    
-    - More efficient approach would mutate a dict (but that's not pure FP)
-    
-    Reduce builds dict step-by-step: there are also immutable
-      Record 1 (Laptop, 1799.98): {} → {'Laptop': 1799.98}
-      Record 2 (Laptop, 849.99): {'Laptop': 1799.98} → {'Laptop': 2649.97}
-      Record 3 (Mouse, 71.22): {'Laptop': 2649.97} → {'Laptop': 2649.97, 'Mouse': 71.22}
-    
-    After reduce: {'Laptop Pro 15': 9876.54, 'Conference Table': 1103.65, ...}
-    After sort: [('Laptop Pro 15', 9876.54), ('Conference Table', 1103.65), ...]
-    After [:n]: top N products
-    
+    """Aggregate revenue per product, then take the N largest by revenue.
+
+    - Accumulate product → revenue in one O(N) pass over a defaultdict
+    - heapq.nlargest keeps a size-n heap: O(K log n) for K products,
+      instead of fully sorting all K just to slice the top n
+
+    (The old version reduced with `{**acc, ...}`, which rebuilt and re-copied
+    the whole accumulator dict for every record — O(N·K) time and a dict
+    allocation per record.)
+
+    After accumulate: {'Laptop Pro 15': 9876.54, 'Conference Table': 1103.65, ...}
+    After nlargest: [('Laptop Pro 15', 9876.54), ('Conference Table', 1103.65), ...]
+
     Raises:
         ValueError: If records is empty or n is invalid
     """
@@ -111,14 +153,16 @@ def top_n_products(records, n=5):
         raise ValueError("Cannot find top products: records list is empty")
     if not isinstance(n, int) or n <= 0:
         raise ValueError(f"n must be a positive integer, got {n}")
-    # Use reduce to build dict: {product_name: total_revenue}
-    totals = reduce(
-        lambda acc, r: {**acc, r.product_name: acc.get(r.product_name, 0.0) + r.amount},  # Merge dicts, accumulate revenue
-        records,
-        {}  # Start with empty dict
-    )
-    # Sort by revenue (descending), slice top N
-    return sorted(totals.items(), key=lambda x: x[1], reverse=True)[:n]
+    # Build dict: {product_name: total_revenue}
+    if isinstance(records, SalesTable):
+        # Columnar fast path: binned accumulation over two parallel columns
+        totals = _group_sum(records.product_name, records.amount)
+    else:
+        totals = defaultdict(float)
+        for r in records:
+            totals[r.product_name] += r.amount
+    # Top N by revenue; itemgetter(1) is a C-level key function
+    return nlargest(n, totals.items(), key=itemgetter(1))
 
 
 # =========================================================
@@ -126,21 +170,21 @@ def top_n_products(records, n=5):
 # =========================================================
 def revenue_by_month(records):
     """Group records by month (YYYY-MM), sum amounts per group.
-    
-    2. Extract month from date
-    3. Sort by month
-    4. Groupby month
-    5.Sum
-    
+
+    Single O(N) hash-accumulate pass; extract_month now runs once per record
+    instead of twice (the sort key and groupby key each called it before).
+
     Extract month: '2024-01-15' → '2024-01', '2024-02-10' → '2024-02'
-    After sort: all Jan records, then Feb, then Mar...
     Result: {'2024-01': 5432.10, '2024-02': 7654.32, '2024-03': 6789.45, ...}
     """
-    recs = sorted(records, key=lambda r: extract_month(r.date))  # Sort by extracted month (required for groupby)
-    return {
-        month: sum(r.amount for r in group)  # Sum amounts for each month group
-        for month, group in groupby(recs, key=lambda r: extract_month(r.date))
-    }
+    if isinstance(records, SalesTable):
+        # Columnar fast path: map the (cached) month extractor down the date
+        # column, then binned accumulation against the amount column
+        return _group_sum(map(extract_month, records.date), records.amount)
+    out = defaultdict(float)
+    for r in records:
+        out[extract_month(r.date)] += r.amount  # Sum amounts for each month
+    return dict(sorted(out.items()))  # key-sort only the K-sized aggregate
 
 
 # =========================================================
@@ -155,7 +199,7 @@ def revenue_by_month(records):
 # =========================================================
 def salesperson_performance(records):
     """Calculate comprehensive metrics per salesperson.
-    
+
     Computes:
     - total_revenue
     - number of orders
@@ -163,44 +207,52 @@ def salesperson_performance(records):
     - number of regions covered
     - effective discount percentage × revenue
 
-    1. Sort by salesperson
-    2. Group records
-    3. Convert group to list
-    4. Compute metrics
-    
+    All metrics accumulate in one O(N) pass over a per-salesperson state dict.
+    (The previous version sorted — O(N log N) just to satisfy groupby — then
+    materialized each group and re-scanned it five times, once per metric.)
+
     Example for 'Alice Johnson' with 3 records:
-      lst = [rec1, rec2, rec3]
-      total_rev = 1799.98 + 849.99 + 899.99 = 3549.96
+      rev = 1799.98 + 849.99 + 899.99 = 3549.96
       orders = 3
       customers = len({'C501', 'C503', 'C507'}) = 3 unique
       regions = len({'North', 'East', 'East'}) = 2 unique
-      total_disc_amt = 199.99 + 149.99 + 99.99 = 449.97
-      total_full = 1999.97 + 999.98 + 999.98 = 3999.93
+      disc = 199.99 + 149.99 + 99.99 = 449.97
+      full = 1999.97 + 999.98 + 999.98 = 3999.93
       effective_discount = 449.97 / 3999.93 = 0.1125 (11.25%)
-    
+
     Result: {'Alice Johnson': {'total_revenue': 3549.96, 'orders': 3, ...}, ...}
     """
-    recs = sorted(records, key=lambda r: r.salesperson)  # Sort by salesperson (required for groupby)
-    perf = {}
-
-    for sp, group in groupby(recs, key=lambda r: r.salesperson):
-        lst = list(group)  # Materialize group iterator for multiple passes
-
-        # Aggregate metrics for this salesperson
-        total_rev = sum(r.amount for r in lst)  # Total revenue after discount
-        orders = len(lst)  # Number of orders
-        customers = len(set(r.customer_id for r in lst))  # Unique customers
-        regions = len(set(r.region for r in lst))  # Unique regions
-        total_disc_amt = sum(r.discount_amount for r in lst)  # Total $ discounted
-        total_full = sum(r.full_price_revenue for r in lst)  # Total $ before discount
-        effective_discount = (total_disc_amt / total_full) if total_full else 0.0  # Average discount rate
-
-        perf[sp] = {
-            "total_revenue": total_rev,
-            "orders": orders,
-            "customers": customers,
-            "regions": regions,
-            "effective_discount": effective_discount,
-        }
+    if isinstance(records, SalesTable):
+        # Columnar fast path: zip the six needed columns directly, skipping
+        # per-row SalesRecord views
+        rows = zip(records.salesperson, records.amount, records.customer_id,
+                   records.region, records.discount_amount, records.full_price_revenue)
+    else:
+        rows = ((r.salesperson, r.amount, r.customer_id, r.region,
+                 r.discount_amount, r.full_price_revenue) for r in records)
 
-    return perf
+    acc = {}
+    for sp, amount, customer_id, region, disc_amt, full in rows:
+        st = acc.get(sp)
+        if st is None:
+            st = acc[sp] = {
+                "rev": 0.0, "orders": 0, "customers": set(),
+                "regions": set(), "disc": 0.0, "full": 0.0,
+            }
+        st["rev"] += amount
+        st["orders"] += 1
+        st["customers"].add(customer_id)
+        st["regions"].add(region)
+        st["disc"] += disc_amt
+        st["full"] += full
+
+    return {
+        sp: {
+            "total_revenue": st["rev"],
+            "orders": st["orders"],
+            "customers": len(st["customers"]),
+            "regions": len(st["regions"]),
+            "effective_discount": (st["disc"] / st["full"]) if st["full"] else 0.0,
+        }
+        for sp, st in acc.items()
+    }
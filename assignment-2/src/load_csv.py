@@ -3,42 +3,50 @@ Functional CSV reader → returns list[SalesRecord]
 """
 
 import csv
-from .model import SalesRecord
+from sys import intern
+from .model import SalesRecord, SalesTable
 from pathlib import Path
 
+# Column order expected in the CSV header (any on-disk order is accepted;
+# indexes are resolved from the header row once per file)
+_FIELDS = (
+    "order_id", "date", "customer_id", "product_id", "product_name",
+    "category", "quantity", "unit_price", "discount", "region", "salesperson",
+)
 
-def _row_to_record():
+
+def _row_to_record(idx):
     """
-    Convert a CSV row → SalesRecord instance.
+    Build a converter from a positional CSV row → SalesRecord instance.
+
+    Functional style: reader → map(row_to_record) → list. The converter works
+    on plain csv.reader lists — no dict per row, no per-field string hashing;
+    each field's position is bound once here from the resolved header indexes.
+
+    Args:
+        idx: Mapping of field name → column index from the header row
 
-    Functional style: reader → map(row_to_record) → list.
-    
     Returns:
-        Lambda function that converts dict row to SalesRecord
-        
+        Function that converts a positional row list to SalesRecord
+
     Raises:
         ValueError: If required fields are missing or invalid
         TypeError: If type conversion fails
     """
-    def converter(r):
+    oi, di, ci, pi = idx["order_id"], idx["date"], idx["customer_id"], idx["product_id"]
+    pni, cati, qi = idx["product_name"], idx["category"], idx["quantity"]
+    upi, disi, ri, si = idx["unit_price"], idx["discount"], idx["region"], idx["salesperson"]
+
+    def converter(row):
         try:
-            # Validate required fields
-            required_fields = [
-                "order_id", "date", "customer_id", "product_id", "product_name",
-                "category", "quantity", "unit_price", "discount", "region", "salesperson"
-            ]
-            missing = [f for f in required_fields if f not in r]
-            if missing:
-                raise ValueError(f"Missing required fields: {missing}")
-            
             # Convert with type validation
             try:
-                quantity = int(r["quantity"])
-                unit_price = float(r["unit_price"])
-                discount = float(r["discount"])
+                quantity = int(row[qi])
+                unit_price = float(row[upi])
+                discount = float(row[disi])
             except ValueError as e:
-                raise ValueError(f"Type conversion error in row {r.get('order_id', 'unknown')}: {e}")
-            
+                raise ValueError(f"Type conversion error in row {row[oi] if len(row) > oi else 'unknown'}: {e}")
+
             # Validate ranges
             if quantity < 0:
                 raise ValueError(f"Quantity cannot be negative: {quantity}")
@@ -46,70 +54,176 @@ def _row_to_record():
                 raise ValueError(f"Unit price cannot be negative: {unit_price}")
             if not (0 <= discount <= 1):
                 raise ValueError(f"Discount must be between 0 and 1: {discount}")
-            
+
+            # Intern the low-cardinality fields: each distinct region/
+            # category/product/salesperson string is stored once instead of
+            # once per row, and downstream dict-key hashing on them becomes a
+            # pointer compare.
+            # customer_id is interned too: salesperson_performance builds
+            # distinct-customer sets, and interned ids make that set hashing a
+            # cached-hash pointer compare with one string object per customer.
             return SalesRecord(
-                order_id=r["order_id"],
-                date=r["date"],
-                customer_id=r["customer_id"],
-                product_id=r["product_id"],
-                product_name=r["product_name"],
-                category=r["category"],
+                order_id=row[oi],
+                date=row[di],
+                customer_id=intern(row[ci]),
+                product_id=row[pi],
+                product_name=intern(row[pni]),
+                category=intern(row[cati]),
                 quantity=quantity,
                 unit_price=unit_price,
                 discount=discount,
-                region=r["region"],
-                salesperson=r["salesperson"],
-                raw=r,
+                region=intern(row[ri]),
+                salesperson=intern(row[si]),
             )
-        except (ValueError, TypeError, KeyError) as e:
-            raise ValueError(f"Error parsing CSV row {r.get('order_id', 'unknown')}: {e}")
-    
+        except (ValueError, TypeError, IndexError) as e:
+            raise ValueError(f"Error parsing CSV row {row[oi] if len(row) > oi else 'unknown'}: {e}")
+
     return converter
 
 
-def load_sales_csv(path: str):
+def _read_records(f):
+    """Parse an open CSV stream into a list of SalesRecord (shared core)."""
+    reader = csv.reader(f)
+
+    # Validate CSV has headers
+    header = next(reader, None)
+    if not header:
+        raise ValueError("CSV file has no headers")
+    missing = [name for name in _FIELDS if name not in header]
+    if missing:
+        raise ValueError(f"Missing required fields: {missing}")
+
+    converter = _row_to_record({name: header.index(name) for name in _FIELDS})
+    records = list(map(converter, reader))
+
+    if not records:
+        raise ValueError("CSV file contains no data rows")
+
+    return records
+
+
+def load_sales_csv(src):
     """
     Load CSV into list of SalesRecord objects using a pure FP pipeline.
-    
+
     Args:
-        path: Path to CSV file
-        
+        src: Path to CSV file, or an already-open text file-like object
+            (anything with .read, e.g. io.StringIO) — the latter skips the
+            filesystem entirely
+
     Returns:
         List of SalesRecord objects
-        
+
     Raises:
         FileNotFoundError: If CSV file doesn't exist
         PermissionError: If file cannot be read
         ValueError: If CSV is malformed or contains invalid data
     """
+    if hasattr(src, "read"):
+        try:
+            return _read_records(src)
+        except csv.Error as e:
+            raise ValueError(f"CSV parsing error: {e}")
+
     # Validate path
+    csv_path = Path(src)
+    if not csv_path.exists():
+        raise FileNotFoundError(f"CSV file not found: {src}")
+    if not csv_path.is_file():
+        raise ValueError(f"Path is not a file: {src}")
+
+    path = src
+    try:
+        with open(path, newline="", encoding="utf-8") as f:
+            return _read_records(f)
+
+    except PermissionError as e:
+        raise PermissionError(f"Cannot read file {path}: {e}")
+    except csv.Error as e:
+        raise ValueError(f"CSV parsing error in {path}: {e}")
+    except UnicodeDecodeError as e:
+        raise ValueError(f"File encoding error in {path}: {e}")
+    except Exception as e:
+        raise ValueError(f"Error loading CSV from {path}: {e}")
+
+
+def load_sales_table(path: str):
+    """
+    Load CSV straight into a columnar SalesTable — no per-row SalesRecord.
+
+    csv.reader hands back plain lists, skipping DictReader's per-row dict
+    allocation (~3x faster to parse), and each cell is appended directly to
+    its column; the derived revenue columns are computed once by SalesTable.
+    Column order in the file doesn't matter: indexes are resolved from the
+    header row.
+
+    Args:
+        path: Path to CSV file
+
+    Returns:
+        SalesTable with one entry per data row
+
+    Raises:
+        FileNotFoundError: If CSV file doesn't exist
+        PermissionError: If file cannot be read
+        ValueError: If CSV is malformed or contains invalid data
+    """
     csv_path = Path(path)
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV file not found: {path}")
     if not csv_path.is_file():
         raise ValueError(f"Path is not a file: {path}")
-    
+
     try:
         with open(path, newline="", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            
-            # Validate CSV has headers
-            if not reader.fieldnames:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if not header:
                 raise ValueError("CSV file has no headers")
-            
-            converter = _row_to_record()
-            records = list(map(converter, reader))
-            
-            if not records:
+
+            missing = [name for name in _FIELDS if name not in header]
+            if missing:
+                raise ValueError(f"Missing required fields: {missing}")
+            # Resolve each field's position once, then index rows positionally
+            idx = {name: header.index(name) for name in _FIELDS}
+
+            cols = {name: [] for name in _FIELDS}
+            for row in reader:
+                try:
+                    quantity = int(row[idx["quantity"]])
+                    unit_price = float(row[idx["unit_price"]])
+                    discount = float(row[idx["discount"]])
+                except (ValueError, IndexError) as e:
+                    raise ValueError(f"Type conversion error in row {row[:1] or 'unknown'}: {e}")
+                if quantity < 0:
+                    raise ValueError(f"Quantity cannot be negative: {quantity}")
+                if unit_price < 0:
+                    raise ValueError(f"Unit price cannot be negative: {unit_price}")
+                if not (0 <= discount <= 1):
+                    raise ValueError(f"Discount must be between 0 and 1: {discount}")
+
+                cols["order_id"].append(row[idx["order_id"]])
+                cols["date"].append(row[idx["date"]])
+                cols["customer_id"].append(intern(row[idx["customer_id"]]))
+                cols["product_id"].append(row[idx["product_id"]])
+                # Same interning as _row_to_record: one string object per
+                # distinct value in the low-cardinality columns
+                cols["product_name"].append(intern(row[idx["product_name"]]))
+                cols["category"].append(intern(row[idx["category"]]))
+                cols["quantity"].append(quantity)
+                cols["unit_price"].append(unit_price)
+                cols["discount"].append(discount)
+                cols["region"].append(intern(row[idx["region"]]))
+                cols["salesperson"].append(intern(row[idx["salesperson"]]))
+
+            if not cols["order_id"]:
                 raise ValueError("CSV file contains no data rows")
-            
-            return records
-            
+
+            return SalesTable(**cols)
+
     except PermissionError as e:
         raise PermissionError(f"Cannot read file {path}: {e}")
     except csv.Error as e:
         raise ValueError(f"CSV parsing error in {path}: {e}")
     except UnicodeDecodeError as e:
         raise ValueError(f"File encoding error in {path}: {e}")
-    except Exception as e:
-        raise ValueError(f"Error loading CSV from {path}: {e}")
@@ -2,9 +2,10 @@
 CLI runner for assignment-2.
 """
 
-from src.load_csv import load_sales_csv
+from src.load_csv import load_sales_table
 import src.analyzer as analyzer
 import src.reporting as reporting
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import sys
 import logging
@@ -30,58 +31,71 @@ def run():
             raise ValueError(f"Path is not a file: {DATA_PATH}")
         
         logging.info(f"Loading data from: {DATA_PATH}")
-        records = load_sales_csv(DATA_PATH)
-        
+        # Stream the CSV straight into columns; every analysis has a columnar
+        # fast path now, so no per-row SalesRecord objects are built at all.
+        table = load_sales_table(DATA_PATH)
+
         # Validate records loaded
-        if not records:
+        if not table:
             raise ValueError("No records loaded from CSV file")
-        
-        logging.info(f"Loaded {len(records)} records successfully")
-
-        # 1. Total revenue
-        try:
-            total_rev = analyzer.total_revenue(records)
-            print(f"Total Revenue: {total_rev:.2f}")
-        except Exception as e:
-            logging.error(f"Error calculating total revenue: {e}")
-            raise
-
-        # 2. Revenue by region
-        try:
-            reporting.print_kv_dict("Revenue by Region", analyzer.revenue_by_region(records))
-        except Exception as e:
-            logging.error(f"Error analyzing revenue by region: {e}")
-            raise
-
-        # 3. Revenue by category
-        try:
-            reporting.print_kv_dict("Revenue by Category", analyzer.revenue_by_category(records))
-        except Exception as e:
-            logging.error(f"Error analyzing revenue by category: {e}")
-            raise
-
-        # 4. Top 5 products
-        try:
-            reporting.print_top_products("Top 5 Products", analyzer.top_n_products(records, 5))
-        except Exception as e:
-            logging.error(f"Error analyzing top products: {e}")
-            raise
-
-        # 5. Revenue by month
-        try:
-            reporting.print_kv_dict("Revenue by Month", analyzer.revenue_by_month(records))
-        except Exception as e:
-            logging.error(f"Error analyzing revenue by month: {e}")
-            raise
-
-        # 6. Salesperson performance
-        try:
-            perf = analyzer.salesperson_performance(records)
-            reporting.print_salesperson_summary(perf, top=5)
-        except Exception as e:
-            logging.error(f"Error analyzing salesperson performance: {e}")
-            raise
-            
+
+        logging.info(f"Loaded {len(table)} records successfully")
+
+        # The six analyses are independent, so submit them all to a thread
+        # pool and only block when each result is needed for printing. The
+        # printing below stays sequential (and in the original order) so the
+        # report output is deterministic.
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            f_total = pool.submit(analyzer.total_revenue, table)
+            f_region = pool.submit(analyzer.revenue_by_region, table)
+            f_category = pool.submit(analyzer.revenue_by_category, table)
+            f_top = pool.submit(analyzer.top_n_products, table, 5)
+            f_month = pool.submit(analyzer.revenue_by_month, table)
+            f_perf = pool.submit(analyzer.salesperson_performance, table)
+
+            # 1. Total revenue
+            try:
+                print(f"Total Revenue: {f_total.result():.2f}")
+            except Exception as e:
+                logging.error(f"Error calculating total revenue: {e}")
+                raise
+
+            # 2. Revenue by region
+            try:
+                reporting.print_kv_dict("Revenue by Region", f_region.result())
+            except Exception as e:
+                logging.error(f"Error analyzing revenue by region: {e}")
+                raise
+
+            # 3. Revenue by category
+            try:
+                reporting.print_kv_dict("Revenue by Category", f_category.result())
+            except Exception as e:
+                logging.error(f"Error analyzing revenue by category: {e}")
+                raise
+
+            # 4. Top 5 products
+            try:
+                reporting.print_top_products("Top 5 Products", f_top.result())
+            except Exception as e:
+                logging.error(f"Error analyzing top products: {e}")
+                raise
+
+            # 5. Revenue by month
+            try:
+                reporting.print_kv_dict("Revenue by Month", f_month.result())
+            except Exception as e:
+                logging.error(f"Error analyzing revenue by month: {e}")
+                raise
+
+            # 6. Salesperson performance
+            try:
+                reporting.print_salesperson_summary(f_perf.result(), top=5)
+            except Exception as e:
+                logging.error(f"Error analyzing salesperson performance: {e}")
+                raise
+
+
         logging.info("All analyses completed successfully")
         
     except FileNotFoundError as e:
@@ -2,10 +2,15 @@
 Data model for sales records.
 Defines the SalesRecord structure with type validation.
 """
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 
 
-@dataclass
+# slots=True drops the per-instance __dict__ (~100 bytes/record) — with a
+# million records that is the difference between the working set fitting in
+# cache or not, and attribute reads get a fixed slot offset instead of a dict
+# lookup.
+@dataclass(slots=True)
 class SalesRecord:
     order_id: str
     date: str
@@ -18,19 +23,107 @@ class SalesRecord:
     discount: float
     region: str
     salesperson: str
-    raw: dict # just in case
-
-    @property
-    def amount(self) -> float:
-        """Revenue after discount."""
-        return self.quantity * self.unit_price * (1 - self.discount)
-
-    @property
-    def full_price_revenue(self) -> float:
-        """Revenue without discount."""
-        return self.quantity * self.unit_price
-
-    @property
-    def discount_amount(self) -> float:
-        """Total discount applied."""
-        return self.quantity * self.unit_price * self.discount
+    raw: dict = None  # original CSV row; only populated when a caller asks for it
+
+    # Derived revenue figures, computed once at construction. Every analysis
+    # reads these per record, so eager plain attributes beat @property
+    # (descriptor dispatch + 3 multiplications on each of ~9 accesses per run).
+    amount: float = field(init=False)  # Revenue after discount
+    full_price_revenue: float = field(init=False)  # Revenue without discount
+    discount_amount: float = field(init=False)  # Total discount applied
+
+    def __post_init__(self):
+        # All three figures share the gross product; compute it once
+        gross = self.quantity * self.unit_price
+        self.amount = gross * (1 - self.discount)
+        self.full_price_revenue = gross
+        self.discount_amount = gross * self.discount
+
+
+@dataclass
+class SalesTable:
+    """
+    Column-oriented (structure-of-arrays) view of a sales dataset.
+
+    Stores each field as a parallel column instead of one SalesRecord object
+    per row, so aggregations can stream a column with C-level iteration
+    (zip/sum) instead of chasing a Python attribute lookup per record. The
+    derived revenue columns are precomputed once at construction, mirroring
+    SalesRecord.__post_init__.
+
+    Numeric columns are held as array.array — 8 packed bytes per value rather
+    than a pointer to a boxed Python number, so a column scan reads a
+    contiguous buffer (and fsum/zip consume it without extra indirection).
+    """
+
+    order_id: list
+    date: list
+    customer_id: list
+    product_id: list
+    product_name: list
+    category: list
+    quantity: list
+    unit_price: list
+    discount: list
+    region: list
+    salesperson: list
+
+    # Derived revenue columns, computed once at construction
+    amount: list = field(init=False)
+    full_price_revenue: list = field(init=False)
+    discount_amount: list = field(init=False)
+
+    def __post_init__(self):
+        # Pack the numeric input columns ('q' = signed 8-byte int, 'd' = double)
+        self.quantity = array("q", self.quantity)
+        self.unit_price = array("d", self.unit_price)
+        self.discount = array("d", self.discount)
+
+        amount, full, disc = array("d"), array("d"), array("d")
+        for q, p, d in zip(self.quantity, self.unit_price, self.discount):
+            gross = q * p
+            amount.append(gross * (1 - d))
+            full.append(gross)
+            disc.append(gross * d)
+        self.amount = amount
+        self.full_price_revenue = full
+        self.discount_amount = disc
+
+    @classmethod
+    def from_records(cls, records):
+        """Transpose a list[SalesRecord] into columns (one O(N) pass per field)."""
+        return cls(
+            order_id=[r.order_id for r in records],
+            date=[r.date for r in records],
+            customer_id=[r.customer_id for r in records],
+            product_id=[r.product_id for r in records],
+            product_name=[r.product_name for r in records],
+            category=[r.category for r in records],
+            quantity=[r.quantity for r in records],
+            unit_price=[r.unit_price for r in records],
+            discount=[r.discount for r in records],
+            region=[r.region for r in records],
+            salesperson=[r.salesperson for r in records],
+        )
+
+    def __len__(self):
+        """Number of rows in the table."""
+        return len(self.order_id)
+
+    def row(self, i):
+        """Materialize row i as a SalesRecord (handy for spot checks/debugging)."""
+        return SalesRecord(
+            self.order_id[i], self.date[i], self.customer_id[i],
+            self.product_id[i], self.product_name[i], self.category[i],
+            self.quantity[i], self.unit_price[i], self.discount[i],
+            self.region[i], self.salesperson[i],
+        )
+
+    def __iter__(self):
+        """Yield each row as a SalesRecord.
+
+        Compatibility path so code written against list[SalesRecord] still
+        works; column access stays the fast path since this re-boxes a record
+        per row.
+        """
+        return map(self.row, range(len(self.order_id)))
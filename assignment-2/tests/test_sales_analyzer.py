@@ -1,11 +1,18 @@
 """Test all sales analysis functions with sample data."""
 
-from src.model import SalesRecord
+import pytest
+
+from src.model import SalesRecord, SalesTable
 from src import analyzer
 
 
-def sample_records():
-    """Create test dataset: 4 records across 2 regions, 2 categories, 2 months, 3 salespeople."""
+@pytest.fixture(scope="module")
+def records():
+    """Test dataset: 4 records across 2 regions, 2 categories, 2 months, 3 salespeople.
+
+    Module-scoped: the analyzer functions are pure over their input, so one
+    shared list is safe and the records are built once instead of per test.
+    """
     return [
         SalesRecord("1", "2024-01-01", "C1", "P1", "Laptop",
                     "Electronics", 1, 1000.0, 0.0, "US", "S1", {}),
@@ -18,47 +25,47 @@ def sample_records():
     ]
 
 
-def test_total_revenue():
-    """Verify sum of all revenue after discounts: 1000 + 50 + 54 + 64 = 1168."""
-    records = sample_records()
-    assert analyzer.total_revenue(records) == 1168.0
-
-
-def test_revenue_by_region():
-    """Verify revenue grouped by region: US vs EU breakdown."""
-    records = sample_records()
-    out = analyzer.revenue_by_region(records)
-    assert out["US"] == 1050.0
-    assert out["EU"] == 118.0
-
-
-def test_revenue_by_category():
-    """Verify revenue grouped by category: Electronics vs Clothing."""
-    records = sample_records()
-    out = analyzer.revenue_by_category(records)
-    assert out["Electronics"] == 1050.0
-    assert out["Clothing"] == 118.0
-
-
-def test_top_n_products():
+@pytest.mark.parametrize(
+    "analysis,expected",
+    [
+        (analyzer.total_revenue, 1168.0),
+        (analyzer.revenue_by_region, {"US": 1050.0, "EU": 118.0}),
+        (analyzer.revenue_by_category, {"Electronics": 1050.0, "Clothing": 118.0}),
+        (analyzer.revenue_by_month, {"2024-01": 1050.0, "2024-02": 118.0}),
+    ],
+    ids=["total_revenue", "by_region", "by_category", "by_month"],
+)
+def test_revenue_analyses(records, analysis, expected):
+    """Verify each revenue analysis against the hand-computed expectation.
+
+    Cases (after discounts): total 1000 + 50 + 54 + 64 = 1168; grouped by
+    region US/EU, category Electronics/Clothing, and month Jan/Feb. One
+    parametrized test so the cases share setup and shard cleanly under
+    pytest-xdist.
+    """
+    assert analysis(records) == expected
+
+
+def test_top_n_products(records):
     """Verify top 2 products by revenue: Laptop (1000), Shoes (64)."""
-    records = sample_records()
     top = analyzer.top_n_products(records, n=2)
     assert top[0][0] == "Laptop"
     assert top[1][0] == "Shoes"
 
 
-def test_revenue_by_month():
-    """Verify revenue grouped by month: January vs February."""
-    records = sample_records()
-    out = analyzer.revenue_by_month(records)
-    assert out["2024-01"] == 1050.0
-    assert out["2024-02"] == 118.0
+def test_columnar_parity(records):
+    """Every analyzer's SalesTable fast path must match its record-list result."""
+    table = SalesTable.from_records(records)
+    assert analyzer.total_revenue(table) == analyzer.total_revenue(records)
+    assert analyzer.revenue_by_region(table) == analyzer.revenue_by_region(records)
+    assert analyzer.revenue_by_category(table) == analyzer.revenue_by_category(records)
+    assert analyzer.revenue_by_month(table) == analyzer.revenue_by_month(records)
+    assert analyzer.top_n_products(table, n=2) == analyzer.top_n_products(records, n=2)
+    assert analyzer.salesperson_performance(table) == analyzer.salesperson_performance(records)
 
 
-def test_salesperson_performance():
+def test_salesperson_performance(records):
     """Verify salesperson metrics: order count, unique customers, total revenue."""
-    records = sample_records()
     perf = analyzer.salesperson_performance(records)
 
     # S1 sold Laptop + Mouse to same customer C1
@@ -14,13 +14,11 @@ def test_pipeline():
                     "Electronics", 1, 80.0, 0.0, "EU", "S2", {}),
     ]
 
-    # Filter records > $70, map to product names, sort alphabetically
-    names = sorted(
-        map(
-            lambda r: r.product_name,
-            filter(lambda r: r.amount > 70.0, records),
-        )
-    )
+    # Filter records > $70, map to product names, sort alphabetically — one
+    # comprehension instead of a lambda frame per record for filter and map
+    # each, then an in-place sort (no second list allocated)
+    names = [r.product_name for r in records if r.amount > 70.0]
+    names.sort()
 
     # Should include Keyboard ($80) and Laptop ($1000), excluding Mouse ($50)
     assert names == ["Keyboard", "Laptop"]
@@ -1,6 +1,6 @@
 """Test CSV loading and parsing into SalesRecord objects."""
 
-import tempfile
+import io
 import textwrap
 
 from src.load_csv import load_sales_csv
@@ -14,12 +14,8 @@ def test_load_csv():
     2,2024-01-02,C2,P2,Mouse,Electronics,2,25,0.0,US,S2
     """)
 
-    # Create temporary CSV file for testing
-    with tempfile.NamedTemporaryFile(mode="w+", suffix=".csv", delete=True) as tmp:
-        tmp.write(csv_content)
-        tmp.flush()
-
-        records = load_sales_csv(tmp.name)
+    # In-memory stream: no temp file, no disk I/O
+    records = load_sales_csv(io.StringIO(csv_content))
 
     # Validate record count and field values
     assert len(records) == 2